@@ -0,0 +1,116 @@
+"""Offline FEC profile benchmark for the DxWiFi transmitter
+
+Feeds synthetic frames through libdxwifi's encoder with each FEC profile from
+transmission_configs.yaml, using tx's test mode (frames are written to a pcap
+file named by --dev instead of a radio). For every profile it reports the
+bytes put on the air, the coding overhead, the goodput that leaves at the
+link rate and the CPU time spent encoding. Run on the target from the repo
+root, with the libdxwifi bindings built:
+
+    python3 benchmarks/fec_profiles.py --files 5 --size 100000
+
+The simulated channel is kept lossless: tx drops simulated losses before they
+reach the pcap, so the overhead would read lower on a worse link. How much
+loss each profile survives needs the receiver and is not measured here.
+"""
+
+import argparse
+import os
+import resource
+import struct
+import tempfile
+import time
+from multiprocessing import Process
+
+from oresat_dxwifi.transmission import profiles
+from oresat_dxwifi.transmission.transmission import Transmitter
+
+PCAP_HEADER_SIZE = 24
+PCAP_RECORD_HEADER = struct.Struct("<IIII")
+
+
+def read_pcap(path: str) -> tuple:
+    """Returns (frame count, captured bytes) of a pcap file"""
+    frames = 0
+    size = 0
+
+    with open(path, "rb") as f:
+        f.seek(PCAP_HEADER_SIZE)
+        while True:
+            header = f.read(PCAP_RECORD_HEADER.size)
+            if len(header) < PCAP_RECORD_HEADER.size:
+                break
+            _, _, caplen, _ = PCAP_RECORD_HEADER.unpack(header)
+            f.seek(caplen, os.SEEK_CUR)
+            frames += 1
+            size += caplen
+
+    return frames, size
+
+
+def children_cpu() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_profile(profile: dict, input_dir: str, work_dir: str) -> dict:
+    """Encodes every synthetic frame with one profile"""
+    pcap_path = os.path.join(work_dir, f"{profile['name']}.pcap")
+    overrides = {
+        **profiles.profile_overrides(profile),
+        "is_test": True,
+        "device": pcap_path,
+        "error_rate": 0,
+        "packet_loss": 0,
+        "daemon_used": False,
+        "no_listen": True,
+        "syslog": False,
+        "verbose": False,
+        "quiet": True,
+    }
+    tx = Transmitter(input_dir, False, overrides)
+
+    cpu = children_cpu()
+    start = time.perf_counter()
+    p = Process(target=tx.transmit)
+    p.start()
+    p.join()
+    wall = time.perf_counter() - start
+    cpu = children_cpu() - cpu
+
+    if p.exitcode != 0 or not os.path.isfile(pcap_path):
+        raise RuntimeError(f"tx failed for profile {profile['name']}")
+
+    frames, air_bytes = read_pcap(pcap_path)
+    return {"frames": frames, "air_bytes": air_bytes, "wall": wall, "cpu": cpu}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5, help="synthetic frames to send")
+    parser.add_argument("--size", type=int, default=100_000, help="bytes per synthetic frame")
+    parser.add_argument("--rate", type=float, default=1, help="link bit rate in Mbps")
+    args = parser.parse_args()
+
+    payload = args.files * args.size
+
+    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as work_dir:
+        # Random bytes don't compress, like the JPEGs the camera produces
+        for i in range(args.files):
+            with open(os.path.join(input_dir, f"frame-{i:03d}.jpeg"), "wb") as f:
+                f.write(os.urandom(args.size))
+
+        print(f"{payload} payload bytes in {args.files} files, {args.rate} Mbps link\n")
+        print(f"{'profile':<12} {'frames':>7} {'air bytes':>10} {'overhead':>9} "
+              f"{'goodput':>12} {'cpu s':>7} {'wall s':>7}")
+
+        for profile in profiles.load_profiles():
+            r = run_profile(profile, input_dir, work_dir)
+            overhead = r["air_bytes"] / payload
+            goodput = args.rate * 1000 / overhead if overhead else 0
+            print(f"{profile['name']:<12} {r['frames']:>7} {r['air_bytes']:>10} "
+                  f"{overhead:>8.2f}x {goodput:>7.0f} kbps {r['cpu']:>7.2f} {r['wall']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Import-time and startup benchmark for the DxWiFi OLAF app
+
+Measures how long importing the app entry point and constructing its resource
+and service take, and whether the heavy modules (v4l2py, NumPy and the
+libdxwifi bindings) get imported before they are first needed. Modules olaf
+itself already imports are not counted against the app. Run on the target
+from the repo root (as root, since the service creates /oresat-live-output):
+
+    python3 benchmarks/startup.py
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+# Modules that should only load on the first FILMING, TRANSMISSION or temperature read
+LAZY_MODULES = ["v4l2py", "numpy", "oresat_dxwifi.transmission.tx_module"]
+
+STARTUP_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import olaf
+baseline = set(sys.modules)
+from oresat_dxwifi.resources.temperature import TemperatureResource
+from oresat_dxwifi.services.oresat_live import OresatLiveService
+imported = time.perf_counter()
+temperature = TemperatureResource(is_mock_adc=True)
+service = OresatLiveService(temperature.find_temperature)
+constructed = time.perf_counter()
+print(imported - start, constructed - imported)
+print(",".join(m for m in {lazy} if m in sys.modules and m not in baseline))
+"""
+
+
+def import_times() -> dict:
+    """Returns the cumulative import time in seconds of each top-level import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import oresat_dxwifi.__main__"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+
+    return times
+
+
+def startup() -> tuple:
+    """Returns (import s, construction s, eagerly imported lazy modules)"""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SNIPPET.format(lazy=LAZY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings, loaded = result.stdout.splitlines()[-2:]
+    import_s, construct_s = (float(t) for t in timings.split())
+    return import_s, construct_s, [m for m in loaded.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=5, help="runs to average")
+    parser.add_argument("-t", "--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    times = import_times()
+    print("Slowest imports of oresat_dxwifi.__main__ (cumulative):")
+    for name, t in sorted(times.items(), key=lambda i: i[1], reverse=True)[:args.top]:
+        print(f"  {t * 1000:9.1f} ms  {name}")
+
+    runs = [startup() for _ in range(args.runs)]
+    import_s = sum(r[0] for r in runs) / len(runs)
+    construct_s = sum(r[1] for r in runs) / len(runs)
+    print(f"\nStartup over {args.runs} runs (fresh interpreter each):")
+    print(f"  import:       {import_s * 1000:9.1f} ms")
+    print(f"  construction: {construct_s * 1000:9.1f} ms")
+
+    eager = runs[-1][2]
+    if eager:
+        print(f"\nImported before first use: {', '.join(eager)}")
+    else:
+        print("\nNo lazy modules imported at startup.")
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    main()
+    print(f"\nBenchmark took {time.perf_counter() - start:.1f} s")
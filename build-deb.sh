@@ -38,7 +38,7 @@ done
 
 sh -c "cat > $PKG_NAME-$PKG_VERS/$DEBIAN_DIR/control <<EOF
 Architecture: $ARCH
-Depends: pybind11-dev (=$PYBIND_VERS), python3-pip (=$PIP3_VERS), python3 (=$PY3_VERS)
+Depends: ffmpeg, pybind11-dev (=$PYBIND_VERS), python3-pip (=$PIP3_VERS), python3 (=$PY3_VERS)
 Description: Oresat DXWIFI Software Server: serves video via CAN bus
 Homepage: https://github.com/oresat/oresat-dxwifi-software
 Maintainer: PSAS <oresat@pdx.edu>
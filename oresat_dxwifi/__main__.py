@@ -23,9 +23,10 @@ def main():
 
     app.od["versions"]["sw_version"].value = __version__
 
-    app.add_resource(TemperatureResource(is_mock_adc=mock_radio))
+    temperature = TemperatureResource(is_mock_adc=mock_radio)
+    app.add_resource(temperature)
 
-    app.add_service(OresatLiveService())
+    app.add_service(OresatLiveService(temperature.find_temperature))
 
     dirname = os.path.dirname(os.path.abspath(__file__))
     rest_api.add_template(f'{dirname}/templates/oresat_live.html')
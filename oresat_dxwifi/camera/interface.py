@@ -2,6 +2,7 @@ from olaf import logger
 import time, os, shutil
 from v4l2py.device import VideoCapture, Device, PixelFormat
 from .frame import Frame
+from .video import VideoEncodeError, encode_frames
 
 class CameraInterfaceError(Exception):
     """An error has occured with the camera interface"""
@@ -14,12 +15,16 @@ class CameraInterface:
     image_count: int
     delay: float
     output_dir: str
+    video_codec: str
+    keyframe_interval: int
 
-    def __init__(self, width, height, output_dir):
+    def __init__(self, width, height, output_dir, video_codec="none", keyframe_interval=5):
         self.camera = Device.from_id(0)
         self.width = width
         self.height = height
         self.output_dir = output_dir
+        self.video_codec = video_codec
+        self.keyframe_interval = keyframe_interval
 
     def update_settings(self, val_dict):
         self.camera.controls["brightness"].value = val_dict["brightness"].value
@@ -56,6 +61,19 @@ class CameraInterface:
         for frame in frames:
             frame.save(self.output_dir, self.tar_file)
 
+    def save_video(self, frames: [Frame], fps):
+        if not frames:
+            return
+
+        if self.tar_file:
+            logger.warning("as_tar is ignored in video mode, the video is already compressed")
+
+        try:
+            encode_frames(frames, self.output_dir, fps, self.video_codec, self.keyframe_interval)
+        except VideoEncodeError as e:
+            logger.error(f"{e}. Saving the frames as JPEGs instead.")
+            self.save_frames(frames)
+
     def log_control_values(self):
         for ctrl in self.camera.controls.values():
             logger.info(ctrl)
@@ -87,7 +105,10 @@ class CameraInterface:
         self.tar_file = as_tar
         self.ready_capture()
         frames = self.capture_frames(obj_dict["image_amount"].value, obj_dict["delay"].value, obj_dict["fps"].value)
-        self.save_frames(frames)
+        if self.video_codec == "none":
+            self.save_frames(frames)
+        else:
+            self.save_video(frames, obj_dict["fps"].value)
         self.camera.close()
         
 
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import tempfile
+import time
+from olaf import logger
+
+# Container and ffmpeg arguments per codec. The frames are already JPEGs, so
+# MJPEG is a stream copy into AVI; H.264 re-encodes with inter-frame prediction.
+CODECS = {
+    "mjpeg": ("avi", ["-c:v", "copy"]),
+    "h264": ("mp4", ["-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p"]),
+}
+
+
+class VideoEncodeError(Exception):
+    """An error has occured encoding frames into a video"""
+
+
+def encode_frames(frames, folder, fps, codec, keyframe_interval):
+    if codec not in CODECS:
+        raise VideoEncodeError(f"Unknown video codec {codec}, valid: {list(CODECS)}")
+
+    extension, codec_args = CODECS[codec]
+    filepath = os.path.join(folder, f"camera-{frames[0].timestamp}.{extension}")
+
+    with tempfile.TemporaryDirectory() as frame_dir:
+        for i, frame in enumerate(frames):
+            frame.write_to_file(os.path.join(frame_dir, f"frame-{i:05d}.jpeg"))
+
+        cmd = ["ffmpeg", "-y", "-loglevel", "error",
+               "-framerate", str(fps),
+               "-i", os.path.join(frame_dir, "frame-%05d.jpeg"),
+               *codec_args,
+               "-g", str(keyframe_interval),
+               filepath]
+
+        # ffmpeg is its own process, so the encode already runs off the service's interpreter
+        start = time.monotonic()
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except OSError as e:
+            raise VideoEncodeError(f"Unable to run ffmpeg: {e}")
+        encode_time = time.monotonic() - start
+
+    if result.returncode != 0 or not os.path.isfile(filepath):
+        if os.path.isfile(filepath):
+            os.remove(filepath)
+        error = result.stderr.decode(errors="replace").strip()
+        raise VideoEncodeError(f"ffmpeg failed to encode {filepath}: {error}")
+
+    jpeg_size = sum(len(frame.data) for frame in frames)
+    video_size = os.path.getsize(filepath)
+    logger.info(f"Encoded {len(frames)} frames as {filepath} in {encode_time:.2f} s: "
+                f"{video_size} bytes vs {jpeg_size} bytes as JPEGs "
+                f"({100 * video_size / max(jpeg_size, 1):.1f}%).")
+
+    return filepath
@@ -6,6 +6,9 @@
 #           https://gist.github.com/bpranaw/ea0a1a00b98d4be98b3d2d03dd31d530
 #       The resource then sends the calculated temperature to the Object Directory upon
 #           resource start. An SDO read callback is also implemented
+#       Every possible raw ADC code is converted once, on the first read, into a lookup table,
+#           so a read is a single index instead of a Beta-equation log. NumPy is imported
+#           then too, keeping it off the app startup path.
 
 import math as m
 
@@ -34,6 +37,7 @@ class TemperatureResource(Resource):
         super().__init__()
 
         self.adc = Adc(adc_thermistor_pin, is_mock_adc)
+        self._temperature_table = None
 
     def on_start(self):
         """Sets up an SDO read callback"""
@@ -64,6 +68,9 @@ class TemperatureResource(Resource):
     R25 = 10_000  # Resistance (Ohms)
     B25 = 3435  # Beta (B) value (Kelvin)
 
+    # Returned when the ADC can't be read or the thermistor is open or shorted
+    INVALID_TEMPERATURE = -1000.0
+
     # Temperature Calculation Functions -----------------------------------------------------------
 
     def find_temperature(self) -> float:
@@ -72,18 +79,70 @@ class TemperatureResource(Resource):
         Returns:
             temperature: Calculated temperature value
         """
-        temperature = -1000.0
+        temperature = self.INVALID_TEMPERATURE
 
         try:
-            voltage = self.adc.value
-            resistance = self.calculate_resistance_from_voltage(voltage)
-            temperature = self.calculate_temperature_from_resistance(resistance)
+            temperature = float(self.convert_raw_to_temperature(self.adc.raw))
         except Exception:
             # In theory this should be the only reason for an exception to occur in this situation
             logger.error("Unable to reach ADC")
 
         return temperature
 
+    @property
+    def temperature_table(self):
+        """Temperature lookup table indexed by raw ADC code, built on first use"""
+        if self._temperature_table is None:
+            self._temperature_table = self.build_temperature_table()
+        return self._temperature_table
+
+    def build_temperature_table(self):
+        """Precomputes the temperature for every raw ADC code
+
+        The end codes (0 V and ADC_VIN) mean a shorted or open thermistor and have no finite
+        resistance, so they map to INVALID_TEMPERATURE like any other failed read.
+
+        Returns:
+            table: Temperature in celsius, indexed by raw ADC code
+        """
+        import numpy as np
+
+        raw = np.arange(self.adc.ADC_MAX_VALUE + 1, dtype=np.float64)
+        voltage = raw / self.adc.ADC_MAX_VALUE * self.adc.ADC_VIN
+
+        with np.errstate(divide="ignore"):
+            resistance = voltage * self.R25 / (self.adc.ADC_VIN - voltage)
+            log_ratio = np.log(resistance / self.R25)
+            temperature_in_kelvin = 1 / ((log_ratio / self.B25) + (1 / self.T25))
+
+        table = temperature_in_kelvin - self.KELVIN_OFFSET
+        table[0] = self.INVALID_TEMPERATURE
+        table[-1] = self.INVALID_TEMPERATURE
+
+        return table
+
+    def convert_raw_to_temperature(self, raw):
+        """Converts a batch of raw ADC samples to temperatures with the lookup table
+
+        Args:
+            raw: Raw ADC code or array-like of raw ADC codes
+
+        Returns:
+            temperature: Temperatures in celsius, same shape as raw
+
+        Raises:
+            ValueError: If a code is not an integer or is outside 0..ADC_MAX_VALUE
+        """
+        import numpy as np
+
+        raw = np.asarray(raw)
+        if not np.issubdtype(raw.dtype, np.integer):
+            raise ValueError(f"Raw ADC codes must be integers, not {raw.dtype}")
+        if np.any(raw < 0) or np.any(raw > self.adc.ADC_MAX_VALUE):
+            raise ValueError(f"Raw ADC codes must be between 0 and {self.adc.ADC_MAX_VALUE}")
+
+        return self.temperature_table[raw]
+
     def calculate_resistance_from_voltage(self, voltage: float) -> float:
         """Calculates the resistance based on the given voltage
 
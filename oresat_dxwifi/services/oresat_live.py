@@ -5,11 +5,15 @@ import subprocess
 import time
 from enum import IntEnum
 from multiprocessing import Process
-from yaml import safe_load
 
 from olaf import Service, logger
+from yaml import safe_load
 
-from ..camera.interface import CameraInterface
+from ..transmission import chunking
+from ..transmission import profiles
+from ..transmission.config import load_configs as load_tx_configs
+from ..transmission.dispatcher import TransmitDispatcher, find_monitor_interfaces
+from ..transmission.thermal import ThermalScheduler, ThermalState
 from ..transmission.transmission import Transmitter
 
 
@@ -47,8 +51,17 @@ STATE_TRANSITIONS = {
 class OresatLiveService(Service):
     """Service for capturing and transmitting video"""
 
-    def __init__(self):
-        """Initializes camera interface and sets state"""
+    def __init__(self, read_temperature=None):
+        """Sets state and output directories
+
+        The camera, YAML configs and thermal scheduler are set up on first use
+        (see the camera and thermal properties), so the app reaches STANDBY
+        without opening the v4l2 device or importing v4l2py.
+
+        Args:
+            read_temperature (Callable): Returns the radio temperature in
+                celsius, used to throttle transmission when the radio is hot
+        """
         super().__init__()
         self.state = State.BOOT
 
@@ -57,28 +70,67 @@ class OresatLiveService(Service):
 
         self.IMAGE_OUPUT_DIRECTORY = "/oresat-live-output/frames"
 
-        if not os.path.isdir(self.IMAGE_OUPUT_DIRECTORY):
-            os.makedirs(self.IMAGE_OUPUT_DIRECTORY, exist_ok=True)
-
-        configs = self.load_configs()
-
-        self.camera = CameraInterface(
-            configs["width"],
-            configs["height"],
-            self.IMAGE_OUPUT_DIRECTORY,
-        )
-
-    def monitor_is_valid(self):
-        monitor_path = "/sys/class/net/mon0"
+        self.CHUNK_OUTPUT_DIRECTORY = "/oresat-live-output/chunks"
+
+        for d in [self.IMAGE_OUPUT_DIRECTORY, self.CHUNK_OUTPUT_DIRECTORY]:
+            if not os.path.isdir(d):
+                os.makedirs(d, exist_ok=True)
+
+        self.read_temperature = read_temperature
+        self._camera = None
+        self._thermal = None
+        self.nominal_bit_rate = None
+        self._fec_profile = None
+
+    @property
+    def camera(self):
+        """CameraInterface, created on the first FILMING request"""
+        if self._camera is None:
+            from ..camera.interface import CameraInterface
+
+            configs = self.load_configs()
+            self._camera = CameraInterface(
+                configs["width"],
+                configs["height"],
+                self.IMAGE_OUPUT_DIRECTORY,
+                configs["video_codec"],
+                configs["keyframe_interval"],
+            )
+        return self._camera
+
+    @property
+    def thermal(self) -> ThermalScheduler:
+        """ThermalScheduler, created on the first TRANSMISSION request"""
+        if self._thermal is None:
+            self._thermal = ThermalScheduler(self.read_temperature)
+        return self._thermal
+
+    def monitor_is_valid(self, device="mon0"):
+        monitor_path = f"/sys/class/net/{device}"
         if os.path.isdir(monitor_path):
             with open(os.path.join(monitor_path, "type")) as f:
                 if f.read().strip() != "1":
                     return True
         return False
 
-    def start_monitor(self):
+    def start_monitor(self, device="mon0"):
         cur_dir = os.path.dirname(os.path.abspath(__file__))
-        subprocess.call([f"{cur_dir}/../transmission/startmonitor.sh"])
+        subprocess.call([f"{cur_dir}/../transmission/startmonitor.sh", device])
+
+    def ready_monitors(self):
+        """Puts every monN adapter into monitor mode
+
+        Returns:
+            list[str]: The interfaces in monitor mode, defaulting to mon0
+        """
+        devices = find_monitor_interfaces() or ["mon0"]
+
+        for device in devices:
+            if not self.monitor_is_valid(device):
+                self.start_monitor(device)
+
+        valid = [d for d in devices if self.monitor_is_valid(d)]
+        return valid or ["mon0"]
 
     def load_configs(self):
         """Loads the camera configs from the YAML file"""
@@ -112,6 +164,12 @@ class OresatLiveService(Service):
             read_cb=self.get_bit_rate,
             write_cb=self.update_bit_rate
         )
+        self.node.add_sdo_callbacks(
+            "transmission",
+            subindex="fec_profile",
+            read_cb=self.get_fec_profile,
+            write_cb=self.update_fec_profile
+        )
 
     def get_bit_rate(self):
         """returns the given bit rate of the transmission"""
@@ -135,7 +193,65 @@ class OresatLiveService(Service):
         subprocess.call(["rmmod", "ath9k_htc"])
         subprocess.call(["modprobe", "ath9k-htc"])
         time.sleep(2)
-        self.start_monitor()
+        self.ready_monitors()
+
+    def apply_thermal_state(self, drain=None) -> bool:
+        """Waits out a thermal pause and matches the bit rate to the thermal state
+
+        Args:
+            drain (Callable): Called before pausing or reloading the driver for
+                a bit rate change, to let the other radios finish their files
+
+        Returns:
+            bool: False if the radio stayed too hot to continue the pass
+        """
+        if self.thermal.update() == ThermalState.PAUSED:
+            if drain is not None:
+                drain()
+            if not self.thermal.wait_for_cooldown():
+                return False
+
+        throttled = self.thermal.state == ThermalState.THROTTLED
+
+        if throttled and self.nominal_bit_rate is None:
+            bit_rate = self.get_bit_rate()
+            if bit_rate > self.thermal.throttle_bit_rate:
+                logger.info(f"Lowering bit rate from {bit_rate} while radio is hot")
+                self.nominal_bit_rate = bit_rate
+                if drain is not None:
+                    drain()
+                self.update_bit_rate(self.thermal.throttle_bit_rate)
+        elif not throttled and self.nominal_bit_rate is not None:
+            logger.info(f"Radio cooled down, restoring bit rate {self.nominal_bit_rate}")
+            if drain is not None:
+                drain()
+            self.update_bit_rate(self.nominal_bit_rate)
+            self.nominal_bit_rate = None
+
+        return True
+
+    def get_fec_profile(self) -> int:
+        """Returns the index of the FEC profile used for transmission"""
+        if self._fec_profile is None:
+            self._fec_profile = profiles.default_profile()
+        return self._fec_profile
+
+    def update_fec_profile(self, value: int):
+        """Selects the FEC profile used from the next file transmitted"""
+        fec_profiles = profiles.load_profiles()
+
+        if not 0 <= value < len(fec_profiles):
+            names = [f"{i}: {p['name']}" for i, p in enumerate(fec_profiles)]
+            logger.warning(f"FEC profile {value} is not valid. Valid Values: {names}")
+            return
+
+        logger.info(f"Using FEC profile {fec_profiles[value]['name']}")
+        self._fec_profile = value
+
+    def tx_overrides(self) -> dict:
+        """Transmitter settings from the FEC profile and thermal state"""
+        profile = profiles.load_profiles()[self.get_fec_profile()]
+        return {**profiles.profile_overrides(profile), **self.thermal.tx_overrides()}
 
     def on_end(self) -> None:
         """Sets status state to OFF"""
@@ -153,26 +269,46 @@ class OresatLiveService(Service):
             logger.error("Something went wrong with camera capture...")
             logger.error(error)
 
-    def transmit_file(self, filestr) -> None:
-        """Transmit file at given path string"""
+    def transmit_file(self, filestr) -> bool:
+        """Transmit file at given path string
+
+        Returns:
+            bool: True if the transmitter ran to completion
+        """
+        sent = False
         try:
-            tx = Transmitter(filestr, self.node.od["transmission"]["enable_pa"].value)
+            tx = Transmitter(
+                filestr,
+                self.node.od["transmission"]["enable_pa"].value,
+                self.tx_overrides(),
+            )
             logger.info(f'Transmitting {filestr}...')
             p = Process(target=tx.transmit)
             p.start()
             p.join()
+            sent = p.exitcode == 0
         except Exception as e:
             logger.error(f"Unable to transmit {filestr} due to {e}")
             self.state = State.ERROR
 
         self.node.od["transmission"]["images_transmitted"].value += 1
+        return sent
 
     def transmit_file_test(self) -> None:
         """Transmits the static color bars image"""
         self.state = State.TRANSMISSION
 
-        if not self.monitor_is_valid():
-            self.start_monitor()
+        try:
+            self.ready_monitors()
+
+            if not self.apply_thermal_state():
+                logger.error("Radio too hot, skipping transmission.")
+                self.state = State.STANDBY
+                return
+        except Exception as e:
+            logger.error(f"Unable to start transmission due to {e}")
+            self.state = State.ERROR
+            return
 
         cur_dir = os.path.dirname(os.path.realpath(__file__))
         self.transmit_file(os.path.join(cur_dir, "static/SMPTE_Color_Bars.gif"))
@@ -180,30 +316,111 @@ class OresatLiveService(Service):
         logger.info("Transmission complete.")
         self.state = State.STANDBY
 
+    def chunk_large_files(self) -> None:
+        """Moves files over the chunk threshold into chunks awaiting transmission"""
+        tx_configs = load_tx_configs()
+
+        for f in os.listdir(self.IMAGE_OUPUT_DIRECTORY):
+            f = os.path.join(self.IMAGE_OUPUT_DIRECTORY, f)
+            if os.path.getsize(f) > tx_configs["chunk_threshold"]:
+                chunking.split_file(f, self.CHUNK_OUTPUT_DIRECTORY, tx_configs["chunk_size"])
+                os.unlink(f)
+
+    def queue_retransmit_requests(self) -> None:
+        """Queues the chunks the ground reported missing via the fwrite cache"""
+        cache = self.node.fwrite_cache
+
+        for file in cache.files(chunking.RETRANSMIT_KEYWORD):
+            try:
+                name = chunking.apply_retransmit_request(
+                    self.CHUNK_OUTPUT_DIRECTORY, os.path.join(cache.dir, file.name)
+                )
+                logger.info(f"Queued chunks of {name} for retransmission from {file.name}")
+            except chunking.ChunkError as e:
+                logger.error(e)
+            cache.remove(file.name)
+
+    def handle_result(self, dispatcher) -> None:
+        """Waits for the next file to finish on any radio and records it"""
+        _, filepath, sent, _ = dispatcher.next_result()
+        if sent:
+            chunking.mark_sent(filepath)
+        self.node.od["transmission"]["images_transmitted"].value += 1
+
     def transmit(self) -> None:
-        """Transmits all the images in the image output directory."""
+        """Transmits all the images in the image output directory.
+
+        Large files are sent as chunks. Sent chunks are dropped from the
+        pending list as they go out, so a pass cut short resumes where it
+        stopped, and chunks the ground reports missing through the fwrite
+        cache are queued again.
+
+        Files are spread across every monitor interface (mon0..monN), one
+        worker process per radio. A file is only handed out once a radio is
+        free, so the thermal checks still run between files.
+        """
         self.state = State.TRANSMISSION
 
-        if not self.monitor_is_valid():
-            self.start_monitor()
+        try:
+            self.chunk_large_files()
+            self.queue_retransmit_requests()
+        except Exception as e:
+            logger.error(f"Unable to chunk files due to {e}")
 
-        files = os.listdir(self.IMAGE_OUPUT_DIRECTORY)
+        try:
+            devices = self.ready_monitors()
+            files = [os.path.join(self.IMAGE_OUPUT_DIRECTORY, f)
+                     for f in os.listdir(self.IMAGE_OUPUT_DIRECTORY)]
+            files += chunking.pending_files(self.CHUNK_OUTPUT_DIRECTORY)
+            enable_pa = self.node.od["transmission"]["enable_pa"].value
+        except Exception as e:
+            logger.error(f"Unable to start transmission due to {e}")
+            self.state = State.ERROR
+            return
 
-        for f in files:
-            f = os.path.join(self.IMAGE_OUPUT_DIRECTORY, f)
-            self.transmit_file(f)
+        logger.info(f"Transmitting {len(files)} files on {', '.join(devices)}")
+
+        with TransmitDispatcher(devices, enable_pa) as dispatcher:
+            def drain():
+                while dispatcher.in_flight:
+                    self.handle_result(dispatcher)
+
+            for f in files:
+                try:
+                    if dispatcher.is_full():
+                        self.handle_result(dispatcher)
+
+                    if not self.apply_thermal_state(drain):
+                        logger.error("Radio too hot, stopping transmission early.")
+                        break
+
+                    dispatcher.submit(f, self.tx_overrides(), self.thermal.file_delay())
+                except Exception as e:
+                    logger.error(f"Unable to transmit {f} due to {e}")
+                    self.state = State.ERROR
+                    break
+
+            try:
+                drain()
+                dispatcher.log_stats()
+            except Exception as e:
+                logger.error(f"Unable to finish transmission due to {e}")
+                self.state = State.ERROR
+
+        if self.state == State.ERROR:
+            logger.error("Transmission stopped on an error.")
+            return
 
         logger.info("Transmission complete.")
         self.state = State.STANDBY
 
     def purge(self) -> None:
-        """Deletes all the files in the image directory"""
+        """Deletes all the files in the image and chunk directories"""
         self.state = State.PURGE
 
-        files = os.listdir(self.IMAGE_OUPUT_DIRECTORY)
-        for f in files:
-            f = os.path.join(self.IMAGE_OUPUT_DIRECTORY, f)
-            os.unlink(f)
+        for d in [self.IMAGE_OUPUT_DIRECTORY, self.CHUNK_OUTPUT_DIRECTORY]:
+            for f in os.listdir(d):
+                os.unlink(os.path.join(d, f))
 
         self.state = State.STANDBY
 
@@ -0,0 +1,263 @@
+import json
+import os
+import struct
+import zlib
+from typing import Dict, List
+from olaf import logger
+
+
+# Large outputs are split into fixed-size chunks so a failed pass only costs the
+# chunks the ground didn't get. The receiver names files by arrival order, so
+# each chunk carries a header identifying the file and its position:
+#
+#   magic (4s) | file CRC32 (I) | index (I) | chunk count (I) | payload CRC32 (I) | length (I)
+#
+# A JSON manifest is sent alongside the chunks, and a "<name>.pending" JSON
+# list of chunk indices drives what is sent next. The ground requests a
+# retransmission by uploading a retransmit request to the olaf fwrite cache
+# (an OreSat file with the "retransmit" keyword, e.g.
+# "dxwifi_retransmit_1700000000000.json"), built with retransmit_request():
+#
+#   {"name": "<chunked file name>", "chunks": [<missing indices>]}
+#
+# The requested chunks are added back to the pending list on the next pass.
+CHUNK_MAGIC = b"DXCK"
+CHUNK_HEADER = struct.Struct("!4sIIIII")
+
+CHUNK_SUFFIX = ".chunk"
+MANIFEST_SUFFIX = ".manifest"
+PENDING_SUFFIX = ".pending"
+RETRANSMIT_KEYWORD = "retransmit"
+
+
+class ChunkError(Exception):
+    """A chunk or manifest is malformed or corrupted"""
+
+
+def chunk_name(name: str, index: int) -> str:
+    return f"{name}.{index:05d}{CHUNK_SUFFIX}"
+
+
+def split_file(filepath: str, chunk_dir: str, chunk_size: int) -> str:
+    """Splits a file into numbered chunks with a manifest and pending list.
+
+    Args:
+        filepath (str): File to split
+        chunk_dir (str): Directory to write the chunks to
+        chunk_size (int): Payload bytes per chunk
+
+    Returns:
+        str: Path of the manifest
+    """
+    name = os.path.basename(filepath)
+    size = os.path.getsize(filepath)
+    count = max(1, -(-size // chunk_size))
+
+    file_crc = 0
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            file_crc = zlib.crc32(block, file_crc)
+
+    chunks = []
+    with open(filepath, "rb") as f:
+        for index in range(count):
+            payload = f.read(chunk_size)
+            crc = zlib.crc32(payload)
+            header = CHUNK_HEADER.pack(CHUNK_MAGIC, file_crc, index, count, crc, len(payload))
+
+            with open(os.path.join(chunk_dir, chunk_name(name, index)), "wb") as chunk:
+                chunk.write(header + payload)
+
+            chunks.append({"index": index, "crc32": crc, "length": len(payload)})
+
+    manifest = {
+        "name": name,
+        "size": size,
+        "crc32": file_crc,
+        "chunk_size": chunk_size,
+        "chunks": chunks,
+    }
+    manifest_path = os.path.join(chunk_dir, name + MANIFEST_SUFFIX)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    write_pending(chunk_dir, name, range(count))
+
+    logger.info(f"Split {filepath} into {count} chunks of {chunk_size} bytes.")
+    return manifest_path
+
+
+def load_manifest(manifest_path: str) -> Dict:
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+
+def read_pending(chunk_dir: str, name: str) -> List[int]:
+    """Returns the chunk indices still to be sent for a file"""
+    pending_path = os.path.join(chunk_dir, name + PENDING_SUFFIX)
+    if not os.path.isfile(pending_path):
+        return []
+
+    with open(pending_path, "r") as f:
+        return sorted(set(json.load(f)))
+
+
+def write_pending(chunk_dir: str, name: str, indices) -> None:
+    """Replaces the pending list for a file, removing it once empty"""
+    pending_path = os.path.join(chunk_dir, name + PENDING_SUFFIX)
+    indices = sorted(set(indices))
+
+    if not indices:
+        if os.path.isfile(pending_path):
+            os.remove(pending_path)
+        return
+
+    with open(pending_path, "w") as f:
+        json.dump(indices, f)
+
+
+def pending_files(chunk_dir: str) -> List[str]:
+    """Lists the manifests and chunks that should be sent, in send order.
+
+    Each file with pending chunks contributes its manifest followed by the
+    pending chunks. Pending indices outside the manifest are ignored.
+    """
+    paths = []
+
+    for f in sorted(os.listdir(chunk_dir)):
+        if not f.endswith(MANIFEST_SUFFIX):
+            continue
+
+        manifest_path = os.path.join(chunk_dir, f)
+        manifest = load_manifest(manifest_path)
+        count = len(manifest["chunks"])
+        indices = [i for i in read_pending(chunk_dir, manifest["name"]) if 0 <= i < count]
+
+        if indices:
+            paths.append(manifest_path)
+            paths.extend(os.path.join(chunk_dir, chunk_name(manifest["name"], i))
+                         for i in indices)
+
+    return paths
+
+
+def mark_sent(chunk_path: str) -> None:
+    """Removes a sent chunk from its file's pending list. Manifests are ignored."""
+    if not chunk_path.endswith(CHUNK_SUFFIX):
+        return
+
+    chunk_dir, filename = os.path.split(chunk_path)
+    name, index, _ = filename.rsplit(".", 2)
+    pending = read_pending(chunk_dir, name)
+    write_pending(chunk_dir, name, [i for i in pending if i != int(index)])
+
+
+def apply_retransmit_request(chunk_dir: str, request_path: str) -> str:
+    """Adds the chunks listed in a ground retransmit request to the pending list.
+
+    Returns:
+        str: Name of the chunked file the request is for
+
+    Raises:
+        ChunkError: If the request is malformed or names an unknown file
+    """
+    try:
+        with open(request_path, "r") as f:
+            request = json.load(f)
+        # Only a bare file name, so a request can't write outside chunk_dir
+        name = os.path.basename(request["name"])
+        indices = [int(i) for i in request["chunks"]]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ChunkError(f"Malformed retransmit request {request_path}: {e}")
+
+    manifest_path = os.path.join(chunk_dir, name + MANIFEST_SUFFIX)
+    if not os.path.isfile(manifest_path):
+        raise ChunkError(f"Retransmit request for unknown file {name}")
+
+    count = len(load_manifest(manifest_path)["chunks"])
+    invalid = [i for i in indices if not 0 <= i < count]
+    if invalid:
+        raise ChunkError(f"Retransmit request for {name} has invalid chunks {invalid}")
+
+    write_pending(chunk_dir, name, read_pending(chunk_dir, name) + indices)
+    return name
+
+
+def retransmit_request(manifest: Dict, received_dir: str) -> Dict:
+    """Ground side: builds the retransmit request for the chunks not yet received"""
+    return {"name": manifest["name"], "chunks": missing_chunks(manifest, received_dir)}
+
+
+def read_chunk(chunk_path: str) -> Dict:
+    """Parses and verifies a received chunk.
+
+    Returns:
+        dict: file_crc32, index, count and payload
+
+    Raises:
+        ChunkError: If the header is invalid or the payload is corrupted
+    """
+    with open(chunk_path, "rb") as f:
+        data = f.read()
+
+    if len(data) < CHUNK_HEADER.size:
+        raise ChunkError(f"{chunk_path} is too short to be a chunk")
+
+    magic, file_crc, index, count, crc, length = CHUNK_HEADER.unpack_from(data)
+    payload = data[CHUNK_HEADER.size:]
+
+    if magic != CHUNK_MAGIC:
+        raise ChunkError(f"{chunk_path} is not a chunk")
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ChunkError(f"Chunk {index} in {chunk_path} is corrupted")
+
+    return {"file_crc32": file_crc, "index": index, "count": count, "payload": payload}
+
+
+def missing_chunks(manifest: Dict, received_dir: str) -> List[int]:
+    """Ground side: lists the chunk indices missing or corrupted in a directory.
+
+    See retransmit_request() for the request uploaded with these indices.
+    """
+    received = set()
+
+    for f in os.listdir(received_dir):
+        try:
+            chunk = read_chunk(os.path.join(received_dir, f))
+        except (ChunkError, OSError):
+            continue
+
+        index = chunk["index"]
+        if chunk["file_crc32"] != manifest["crc32"] or index >= len(manifest["chunks"]):
+            continue
+        if manifest["chunks"][index]["crc32"] == zlib.crc32(chunk["payload"]):
+            received.add(index)
+
+    return [c["index"] for c in manifest["chunks"] if c["index"] not in received]
+
+
+def join_chunks(manifest: Dict, received_dir: str, output_path: str) -> None:
+    """Ground side: reassembles a file once every chunk has been received.
+
+    Raises:
+        ChunkError: If chunks are missing or the reassembled file is corrupted
+    """
+    missing = missing_chunks(manifest, received_dir)
+    if missing:
+        raise ChunkError(f"{manifest['name']} is missing chunks {missing}")
+
+    payloads = {}
+    for f in os.listdir(received_dir):
+        try:
+            chunk = read_chunk(os.path.join(received_dir, f))
+        except (ChunkError, OSError):
+            continue
+        if chunk["file_crc32"] == manifest["crc32"]:
+            payloads[chunk["index"]] = chunk["payload"]
+
+    data = b"".join(payloads[c["index"]] for c in manifest["chunks"])
+    if zlib.crc32(data) != manifest["crc32"]:
+        raise ChunkError(f"Reassembled {manifest['name']} failed its CRC check")
+
+    with open(output_path, "wb") as f:
+        f.write(data)
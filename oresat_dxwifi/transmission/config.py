@@ -0,0 +1,22 @@
+import copy
+import os
+from functools import lru_cache
+from typing import Dict
+from yaml import safe_load
+
+
+# The single loader for configs/transmission_configs.yaml. The file is parsed
+# once per process and every caller gets its own copy, so per-file lookups
+# don't re-read the YAML.
+def load_configs() -> Dict:
+    """Returns the transmission configs from the YAML file"""
+    return copy.deepcopy(_parse_configs())
+
+
+@lru_cache(maxsize=None)
+def _parse_configs() -> Dict:
+    dirname = os.path.dirname(os.path.abspath(__file__))
+    tx_cfg_path = os.path.join(dirname, "configs", "transmission_configs.yaml")
+
+    with open(tx_cfg_path, "r") as config_file:
+        return safe_load(config_file)
@@ -0,0 +1,137 @@
+import os
+import re
+import time
+from multiprocessing import Process, Queue
+from typing import Dict, List, Optional
+from olaf import logger
+from .transmission import Transmitter
+
+
+NET_CLASS_PATH = "/sys/class/net"
+MONITOR_NAME = re.compile(r"^mon\d+$")
+
+
+def find_monitor_interfaces() -> List[str]:
+    """Lists the monN interfaces present, in numeric order"""
+    if not os.path.isdir(NET_CLASS_PATH):
+        return []
+
+    names = [n for n in os.listdir(NET_CLASS_PATH) if MONITOR_NAME.match(n)]
+    return sorted(names, key=lambda n: int(n[3:]))
+
+
+def transmit_worker(device: str, enable_pa: bool, tasks: Queue, results: Queue) -> None:
+    """Sends files from the task queue on one radio until it gets None.
+
+    Each file runs in its own child process, like a single-radio transmission,
+    so a crash in the bindings only loses that file. The radio then idles for
+    the file delay sent with the task before taking the next file.
+    """
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+
+        filepath, overrides, file_delay = task
+        start = time.monotonic()
+        sent = False
+
+        try:
+            tx = Transmitter(filepath, enable_pa, {**overrides, "device": device})
+            logger.info(f"Transmitting {filepath} on {device}...")
+            p = Process(target=tx.transmit)
+            p.start()
+            p.join()
+            sent = p.exitcode == 0
+        except Exception as e:
+            logger.error(f"Unable to transmit {filepath} on {device} due to {e}")
+
+        seconds = time.monotonic() - start
+        time.sleep(file_delay)
+        results.put((device, filepath, sent, seconds))
+
+
+class TransmitDispatcher:
+    def __init__(self, devices: List[str], enable_pa: bool) -> None:
+        """Starts one transmit worker process per monitor interface.
+
+        Args:
+            devices (list[str]): Monitor interfaces to transmit on, e.g. ["mon0", "mon1"]
+            enable_pa (bool): Enable the power amplifier on every radio
+        """
+        self.devices = devices
+        self.tasks = Queue()
+        self.results = Queue()
+        self.in_flight = 0
+        self.start = time.monotonic()
+        self.stats = {d: {"files": 0, "failed": 0, "bytes": 0, "seconds": 0.0} for d in devices}
+
+        self.workers = [
+            Process(target=transmit_worker, args=(d, enable_pa, self.tasks, self.results))
+            for d in devices
+        ]
+        for w in self.workers:
+            w.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def is_full(self) -> bool:
+        """True when every radio is busy"""
+        return self.in_flight >= len(self.workers)
+
+    def submit(self, filepath: str, overrides: Optional[Dict] = None,
+               file_delay: float = 0) -> None:
+        """Queues a file for the next free radio
+
+        Args:
+            filepath (str): File to transmit
+            overrides (dict): Transmitter attributes to override
+            file_delay (float): Seconds the radio idles after sending the file
+        """
+        self.tasks.put((filepath, overrides or {}, file_delay))
+        self.in_flight += 1
+
+    def next_result(self) -> tuple:
+        """Waits for a transmission to finish and records it in the stats.
+
+        Returns:
+            tuple: (device, filepath, sent, seconds)
+        """
+        device, filepath, sent, seconds = self.results.get()
+        self.in_flight -= 1
+
+        stats = self.stats[device]
+        stats["seconds"] += seconds
+        if sent:
+            stats["files"] += 1
+            stats["bytes"] += os.path.getsize(filepath) if os.path.isfile(filepath) else 0
+        else:
+            stats["failed"] += 1
+
+        return device, filepath, sent, seconds
+
+    def close(self) -> None:
+        """Stops the workers once they finish their current file"""
+        for _ in self.workers:
+            self.tasks.put(None)
+        for w in self.workers:
+            w.join()
+
+    def log_stats(self) -> None:
+        total_bytes = 0
+        wall = time.monotonic() - self.start
+
+        for device, s in self.stats.items():
+            rate = s["bytes"] * 8 / s["seconds"] / 1000 if s["seconds"] else 0
+            logger.info(f"{device}: {s['files']} sent, {s['failed']} failed, "
+                        f"{s['bytes']} bytes in {s['seconds']:.1f} s ({rate:.1f} kbps)")
+            total_bytes += s["bytes"]
+
+        if len(self.stats) > 1 and wall:
+            rate = total_bytes * 8 / wall / 1000
+            logger.info(f"Aggregate: {total_bytes} bytes, {rate:.1f} kbps "
+                        f"across {len(self.stats)} radios")
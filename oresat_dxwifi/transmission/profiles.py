@@ -0,0 +1,44 @@
+from typing import Dict, List
+from .config import load_configs
+
+
+# Forward-error-correction profiles are defined in transmission_configs.yaml
+# and picked by index at runtime (transmission/fec_profile in the OD). Each
+# profile may set these YAML keys, mapped to their Transmitter attribute.
+PROFILE_SETTINGS = {
+    "code_rate": "code_rate",
+    "control_frame_redundancy": "redundancy",
+    "retransmit_count": "retransmit",
+}
+
+
+class ProfileError(Exception):
+    """An FEC profile is unknown or sets an unsupported key"""
+
+
+def load_profiles() -> List[Dict]:
+    """Returns the FEC profiles in OD index order, each with a "name" key"""
+    return load_configs()["fec_profiles"]
+
+
+def default_profile() -> int:
+    """Returns the index of the profile used until one is selected over the OD"""
+    return load_configs()["fec_profile"]
+
+
+def profile_overrides(profile: Dict) -> Dict:
+    """Converts a profile into Transmitter overrides
+
+    Raises:
+        ProfileError: If the profile sets a key that isn't an FEC setting
+    """
+    overrides = {}
+
+    for key, value in profile.items():
+        if key == "name":
+            continue
+        if key not in PROFILE_SETTINGS:
+            raise ProfileError(f"Profile {profile.get('name')} sets unsupported key {key}")
+        overrides[PROFILE_SETTINGS[key]] = value
+
+    return overrides
@@ -0,0 +1,117 @@
+import time
+from enum import IntEnum
+from typing import Callable, Optional
+from olaf import logger
+from .config import load_configs
+
+
+class ThermalState(IntEnum):
+    NOMINAL = 0
+    THROTTLED = 1
+    PAUSED = 2
+
+
+# Any reading at or below absolute zero is a failed read (TemperatureResource returns
+# -1000 when the ADC can't be reached), so it never throttles or pauses.
+MIN_VALID_TEMPERATURE = -273.15
+
+
+class ThermalScheduler:
+    def __init__(self, read_temperature: Optional[Callable[[], float]] = None) -> None:
+        """Initializes the thermal duty-cycle scheduler.
+
+        Args:
+            read_temperature (Callable): Returns the radio temperature in celsius.
+                If None, the scheduler always reports NOMINAL.
+        """
+        self.read_temperature = read_temperature
+        self.state = ThermalState.NOMINAL
+        self.load_configs()
+
+    def load_configs(self) -> None:
+        """Loads the thermal limits from the transmission YAML file"""
+        configs = load_configs()
+
+        self.throttle_temp = configs["thermal_throttle_temp"]
+        self.unthrottle_temp = configs["thermal_unthrottle_temp"]
+        self.pause_temp = configs["thermal_pause_temp"]
+        self.resume_temp = configs["thermal_resume_temp"]
+
+        self.throttle_file_delay = configs["thermal_file_delay"]
+        self.throttle_delay = configs["thermal_delay"]
+        self.throttle_bit_rate = configs["thermal_bit_rate"]
+
+        self.poll_interval = configs["thermal_poll_interval"]
+        self.max_pause = configs["thermal_max_pause"]
+
+    def update(self) -> ThermalState:
+        """Reads the radio temperature and updates the state.
+
+        PAUSED is held until the temperature drops to the resume threshold and
+        THROTTLED until it drops to the unthrottle threshold, so a reading
+        hovering around a limit doesn't toggle the radio (or reload the driver
+        for a bit rate change) between every file.
+
+        Returns:
+            ThermalState: The new state
+        """
+        if self.read_temperature is None:
+            return self.state
+
+        temperature = self.read_temperature()
+        if temperature <= MIN_VALID_TEMPERATURE:
+            return self.state
+
+        if temperature >= self.pause_temp:
+            state = ThermalState.PAUSED
+        elif self.state == ThermalState.PAUSED and temperature > self.resume_temp:
+            state = ThermalState.PAUSED
+        elif temperature >= self.throttle_temp:
+            state = ThermalState.THROTTLED
+        elif self.state == ThermalState.THROTTLED and temperature > self.unthrottle_temp:
+            state = ThermalState.THROTTLED
+        else:
+            state = ThermalState.NOMINAL
+
+        if state != self.state:
+            logger.info(f"Radio at {temperature:.1f} C, thermal state "
+                        f"{self.state.name} -> {state.name}")
+            self.state = state
+
+        return self.state
+
+    def wait_for_cooldown(self) -> bool:
+        """Blocks while the radio is too hot to transmit.
+
+        Returns:
+            bool: True if transmission may continue, False if the radio did
+                not cool down within thermal_max_pause seconds
+        """
+        start = time.monotonic()
+
+        while self.update() == ThermalState.PAUSED:
+            if time.monotonic() - start >= self.max_pause:
+                logger.error(f"Radio did not cool down within {self.max_pause} s")
+                return False
+            time.sleep(self.poll_interval)
+
+        return True
+
+    def tx_overrides(self) -> dict:
+        """Transmitter settings for the current state.
+
+        The gap between files is left to file_delay(), since the service
+        hands tx one file at a time.
+
+        Returns:
+            dict: Transmitter attributes to override, empty when NOMINAL
+        """
+        if self.state == ThermalState.THROTTLED:
+            return {"delay": self.throttle_delay}
+        return {}
+
+    def file_delay(self) -> float:
+        """Seconds to idle the radio between files in the current state"""
+        if self.state == ThermalState.THROTTLED:
+            return self.throttle_file_delay / 1000
+        return 0
@@ -1,32 +1,36 @@
-import os, subprocess, time
-from yaml import safe_load
+import subprocess, time
 from olaf import logger
-from . import tx_module
+from .config import load_configs
 
 
 # The transmitter currently calls the main wrapper of the python bindings.
 # You can "print(tx_module)" to see the other bindings.
 #
+# The bindings are imported on first use so that importing this
+# module (and starting the OLAF app) doesn't pay for them.
+#
 # @TODO Clean up. Use task-specific function bindings and stop wrapping main().
 class Transmitter:
-    def __init__(self, directory: str, enable_pa: bool) -> None:
+    def __init__(self, directory: str, enable_pa: bool, overrides: dict = None) -> None:
         """Initializes transmission configuration.
 
         Args:
             directory (str): Path of directory with videos to transmit
+            overrides (dict): Config attributes to replace after loading the
+                YAML file, e.g. {"file_delay": 2000}
         """
         self.target_dir_or_file = directory
         self.enable_pa = enable_pa
         self.load_configs()
 
+        for name, value in (overrides or {}).items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Unknown transmission setting: {name}")
+            setattr(self, name, value)
+
     def load_configs(self) -> None:
         """Loads the transmission configs from the YAML file"""
-        dirname = os.path.dirname(os.path.abspath(__file__))
-        tx_cfg_path = os.path.join(dirname, "configs",
-                                "transmission_configs.yaml")
-
-        with open(tx_cfg_path, "r") as config_file:
-            configs = safe_load(config_file)
+        configs = load_configs()
 
         self.device = configs["device"]
         self.code_rate = configs["code_rate"]
@@ -142,6 +146,8 @@ class Transmitter:
         return tx_cmd
 
     def transmit(self) -> None:
+        from . import tx_module
+
         tx_module.main_wrapper(self.configure_transmission())
 
 
@@ -0,0 +1,127 @@
+"""Tests for chunked, resumable transmission of large files"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from oresat_dxwifi.transmission import chunking
+
+
+class TestChunking(unittest.TestCase):
+    CHUNK_SIZE = 1000
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.chunk_dir = os.path.join(self.tmp_dir, "chunks")
+        self.rx_dir = os.path.join(self.tmp_dir, "rx")
+        os.mkdir(self.chunk_dir)
+        os.mkdir(self.rx_dir)
+
+        self.data = os.urandom(3500)
+        self.filepath = os.path.join(self.tmp_dir, "capture.tar")
+        with open(self.filepath, "wb") as f:
+            f.write(self.data)
+
+        self.manifest_path = chunking.split_file(self.filepath, self.chunk_dir, self.CHUNK_SIZE)
+        self.manifest = chunking.load_manifest(self.manifest_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def receive(self, path: str) -> None:
+        """Copies a sent file the way rx names it, by arrival order"""
+        shutil.copy(path, os.path.join(self.rx_dir, f"rx-{len(os.listdir(self.rx_dir)):03d}"))
+
+    def send(self, paths) -> None:
+        for path in paths:
+            self.receive(path)
+            chunking.mark_sent(path)
+
+    def test_split_file(self):
+        self.assertEqual(self.manifest["name"], "capture.tar")
+        self.assertEqual(self.manifest["size"], len(self.data))
+        self.assertEqual([c["length"] for c in self.manifest["chunks"]], [1000, 1000, 1000, 500])
+        self.assertEqual(chunking.read_pending(self.chunk_dir, "capture.tar"), [0, 1, 2, 3])
+
+        chunk = chunking.read_chunk(
+            os.path.join(self.chunk_dir, chunking.chunk_name("capture.tar", 3))
+        )
+        self.assertEqual(chunk["index"], 3)
+        self.assertEqual(chunk["count"], 4)
+        self.assertEqual(chunk["payload"], self.data[3000:])
+
+    def test_pending_files_order(self):
+        names = [os.path.basename(p) for p in chunking.pending_files(self.chunk_dir)]
+        self.assertEqual(names[0], "capture.tar.manifest")
+        self.assertEqual(names[1:], [chunking.chunk_name("capture.tar", i) for i in range(4)])
+
+    def test_mark_sent_resumes(self):
+        """A pass cut short leaves only the unsent chunks pending"""
+        pending = chunking.pending_files(self.chunk_dir)
+        self.send(pending[:3])
+
+        self.assertEqual(chunking.read_pending(self.chunk_dir, "capture.tar"), [2, 3])
+        self.send(chunking.pending_files(self.chunk_dir))
+        self.assertEqual(chunking.pending_files(self.chunk_dir), [])
+        self.assertFalse(os.path.exists(os.path.join(self.chunk_dir, "capture.tar.pending")))
+
+    def test_missing_and_corrupted_chunks(self):
+        pending = chunking.pending_files(self.chunk_dir)
+        self.send(pending[:3])
+        self.assertEqual(chunking.missing_chunks(self.manifest, self.rx_dir), [2, 3])
+
+        # Flip a payload byte in a received chunk
+        received = os.path.join(self.rx_dir, "rx-001")
+        with open(received, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            byte = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        self.assertEqual(chunking.missing_chunks(self.manifest, self.rx_dir), [0, 2, 3])
+
+    def test_retransmit_round_trip(self):
+        """Only the chunks the ground reports missing are sent again"""
+        pending = chunking.pending_files(self.chunk_dir)
+        self.send([p for p in pending if not p.endswith(chunking.chunk_name("capture.tar", 1))])
+        chunking.mark_sent(pending[2])  # chunk 1 was sent but lost on the way
+        self.assertEqual(chunking.pending_files(self.chunk_dir), [])
+
+        request_path = os.path.join(self.tmp_dir, "dxwifi_retransmit_1700000000000.json")
+        with open(request_path, "w") as f:
+            json.dump(chunking.retransmit_request(self.manifest, self.rx_dir), f)
+
+        self.assertEqual(
+            chunking.apply_retransmit_request(self.chunk_dir, request_path), "capture.tar"
+        )
+        resend = chunking.pending_files(self.chunk_dir)
+        self.assertEqual(resend[1:], [pending[2]])
+
+        with self.assertRaises(chunking.ChunkError):
+            chunking.join_chunks(self.manifest, self.rx_dir, self.filepath + ".out")
+
+        self.send(resend)
+        chunking.join_chunks(self.manifest, self.rx_dir, self.filepath + ".out")
+        with open(self.filepath + ".out", "rb") as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_bad_retransmit_requests(self):
+        request_path = os.path.join(self.tmp_dir, "request.json")
+
+        for request in [{"name": "unknown.tar", "chunks": [0]},
+                        {"name": "capture.tar", "chunks": [4]},
+                        {"chunks": [0]}]:
+            with open(request_path, "w") as f:
+                json.dump(request, f)
+            with self.assertRaises(chunking.ChunkError):
+                chunking.apply_retransmit_request(self.chunk_dir, request_path)
+
+        with open(request_path, "w") as f:
+            f.write("not json")
+        with self.assertRaises(chunking.ChunkError):
+            chunking.apply_retransmit_request(self.chunk_dir, request_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for the multi-radio transmit workers"""
+
+import queue
+import unittest
+from unittest import mock
+
+from oresat_dxwifi.transmission import dispatcher
+
+
+class TestTransmitWorker(unittest.TestCase):
+    def test_file_delay_after_file(self):
+        """The radio idles for the file delay once its file is sent"""
+        events = []
+        tasks = queue.Queue()
+        results = queue.Queue()
+        tasks.put(("/tmp/a.jpeg", {}, 2.0))
+        tasks.put(None)
+
+        process = mock.MagicMock(exitcode=0)
+        process.join.side_effect = lambda: events.append("join")
+
+        with mock.patch.object(dispatcher, "Transmitter"), \
+                mock.patch.object(dispatcher, "Process", return_value=process), \
+                mock.patch("time.sleep", lambda s: events.append(("sleep", s))):
+            dispatcher.transmit_worker("mon0", False, tasks, results)
+
+        self.assertEqual(events, ["join", ("sleep", 2.0)])
+        device, filepath, sent, _ = results.get_nowait()
+        self.assertEqual((device, filepath, sent), ("mon0", "/tmp/a.jpeg", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Tests for the OreSat Live service transmission pass"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from collections import deque
+from unittest import mock
+
+from oresat_dxwifi.services.oresat_live import OresatLiveService, State
+
+
+class FakeDispatcher:
+    """Sends every file successfully without starting worker processes.
+
+    Submitted files stay in flight, oldest first, until next_result() is called.
+    """
+
+    last = None
+
+    def __init__(self, devices, enable_pa):
+        self.devices = devices
+        self.queue = deque()
+        self.file_delays = []
+        FakeDispatcher.last = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    @property
+    def in_flight(self):
+        return len(self.queue)
+
+    def is_full(self):
+        return self.in_flight >= len(self.devices)
+
+    def submit(self, filepath, overrides=None, file_delay=0):
+        self.queue.append(filepath)
+        self.file_delays.append(file_delay)
+
+    def next_result(self):
+        return self.devices[0], self.queue.popleft(), True, 0.0
+
+    def log_stats(self):
+        pass
+
+
+class TestTransmit(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        with mock.patch("os.makedirs"):
+            self.service = OresatLiveService(lambda: 20.0)
+
+        self.service.IMAGE_OUPUT_DIRECTORY = os.path.join(self.tmp_dir, "frames")
+        self.service.CHUNK_OUTPUT_DIRECTORY = os.path.join(self.tmp_dir, "chunks")
+        os.mkdir(self.service.IMAGE_OUPUT_DIRECTORY)
+        os.mkdir(self.service.CHUNK_OUTPUT_DIRECTORY)
+        for i in range(3):
+            with open(os.path.join(self.service.IMAGE_OUPUT_DIRECTORY, f"{i}.jpeg"), "wb") as f:
+                f.write(b"\xff\xd8\xff\xd9")
+
+        self.service.node = mock.MagicMock()
+        self.service.node.od["transmission"]["images_transmitted"].value = 0
+        self.service.node.fwrite_cache.files.return_value = []
+
+        patches = [
+            mock.patch.object(OresatLiveService, "ready_monitors", return_value=["mon0"]),
+            mock.patch("oresat_dxwifi.services.oresat_live.TransmitDispatcher", FakeDispatcher),
+            mock.patch("time.sleep"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_pass_returns_to_standby(self):
+        self.service.transmit()
+
+        self.assertEqual(self.service.state, State.STANDBY)
+        self.assertEqual(self.service.node.od["transmission"]["images_transmitted"].value, 3)
+
+    def test_results_recorded_in_send_order(self):
+        """Each result is recorded against the file it belongs to, oldest first"""
+        devices = ["mon0", "mon1"]
+        files = [os.path.join(self.service.IMAGE_OUPUT_DIRECTORY, f)
+                 for f in os.listdir(self.service.IMAGE_OUPUT_DIRECTORY)]
+
+        with mock.patch.object(OresatLiveService, "ready_monitors", return_value=devices), \
+                mock.patch("oresat_dxwifi.transmission.chunking.mark_sent") as mark_sent:
+            self.service.transmit()
+
+        self.assertEqual([c.args[0] for c in mark_sent.call_args_list], files)
+
+    def test_throttled_gap_sent_with_each_file(self):
+        """The gap is slept by the radio after its file, not while the file is sent"""
+        thermal = self.service.thermal
+        thermal.read_temperature = lambda: thermal.throttle_temp
+
+        with mock.patch.object(OresatLiveService, "get_bit_rate",
+                               return_value=thermal.throttle_bit_rate):
+            self.service.transmit()
+
+        self.assertEqual(FakeDispatcher.last.file_delays, [thermal.file_delay()] * 3)
+        self.assertGreater(thermal.file_delay(), 0)
+
+    def test_pause_drains_radios(self):
+        """No file is left transmitting on another radio while waiting out a pause"""
+        thermal = self.service.thermal
+        readings = iter([20.0, 20.0, thermal.pause_temp, thermal.pause_temp])
+        thermal.read_temperature = lambda: next(readings, 20.0)
+        devices = ["mon0", "mon1"]
+        in_flight = []
+
+        def sleep(_):
+            in_flight.append(FakeDispatcher.last.in_flight)
+
+        with mock.patch.object(OresatLiveService, "ready_monitors", return_value=devices), \
+                mock.patch("time.sleep", sleep):
+            self.service.transmit()
+
+        self.assertEqual(in_flight, [0])
+        self.assertEqual(self.service.state, State.STANDBY)
+
+    def test_bit_rate_failure_sets_error(self):
+        """A failing readlink while throttled doesn't leave the state in TRANSMISSION"""
+        self.service.thermal.read_temperature = lambda: self.service.thermal.throttle_temp
+
+        with mock.patch.object(OresatLiveService, "get_bit_rate", side_effect=OSError("readlink")):
+            self.service.transmit()
+
+        self.assertEqual(self.service.state, State.ERROR)
+
+    def test_profile_failure_sets_error(self):
+        with mock.patch.object(OresatLiveService, "tx_overrides", side_effect=KeyError("code")):
+            self.service.transmit()
+
+        self.assertEqual(self.service.state, State.ERROR)
+
+
+if __name__ == "__main__":
+    unittest.main()
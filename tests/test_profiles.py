@@ -0,0 +1,58 @@
+"""Tests for the transmission config loader and FEC profiles"""
+
+import unittest
+from unittest import mock
+
+import yaml
+
+from oresat_dxwifi.transmission import profiles
+from oresat_dxwifi.transmission.config import _parse_configs, load_configs
+from oresat_dxwifi.transmission.transmission import Transmitter
+
+
+class TestConfigLoader(unittest.TestCase):
+    def setUp(self):
+        _parse_configs.cache_clear()
+        self.addCleanup(_parse_configs.cache_clear)
+
+    def test_yaml_parsed_once(self):
+        with mock.patch("oresat_dxwifi.transmission.config.safe_load",
+                        wraps=yaml.safe_load) as safe_load:
+            for _ in range(3):
+                load_configs()
+                profiles.load_profiles()
+                Transmitter("/tmp", False)
+
+        self.assertEqual(safe_load.call_count, 1)
+
+    def test_callers_get_copies(self):
+        load_configs()["fec_profiles"].clear()
+        self.assertTrue(profiles.load_profiles())
+
+
+class TestProfiles(unittest.TestCase):
+    def test_default_profile_matches_static_values(self):
+        """The default profile keeps the settings used before profiles existed"""
+        profile = profiles.load_profiles()[profiles.default_profile()]
+        tx = Transmitter("/tmp", False, profiles.profile_overrides(profile))
+
+        self.assertEqual(tx.code_rate, 0.667)
+        self.assertEqual(tx.redundancy, 0)
+
+    def test_profile_overrides(self):
+        overrides = profiles.profile_overrides(
+            {"name": "test", "code_rate": 0.5, "control_frame_redundancy": 2}
+        )
+        self.assertEqual(overrides, {"code_rate": 0.5, "redundancy": 2})
+
+        tx = Transmitter("/tmp", False, overrides)
+        self.assertIn("--coderate=0.5", tx.configure_transmission())
+        self.assertIn("--redundancy=2", tx.configure_transmission())
+
+    def test_unsupported_key(self):
+        with self.assertRaises(profiles.ProfileError):
+            profiles.profile_overrides({"name": "test", "data_rate": 54})
+
+
+if __name__ == "__main__":
+    unittest.main()
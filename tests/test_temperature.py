@@ -0,0 +1,64 @@
+"""Tests for the thermistor temperature lookup table"""
+
+import unittest
+
+import numpy as np
+
+from oresat_dxwifi.resources.temperature import TemperatureResource
+
+
+class TestTemperatureTable(unittest.TestCase):
+    def setUp(self):
+        self.resource = TemperatureResource(is_mock_adc=True)
+        self.max_code = self.resource.adc.ADC_MAX_VALUE
+
+    def test_table_matches_formula(self):
+        """Every in-range code matches the Beta-equation formula"""
+        table = self.resource.temperature_table
+        self.assertEqual(table.shape, (self.max_code + 1,))
+
+        for raw in range(1, self.max_code):
+            voltage = raw / self.max_code * self.resource.adc.ADC_VIN
+            resistance = self.resource.calculate_resistance_from_voltage(voltage)
+            expected = self.resource.calculate_temperature_from_resistance(resistance)
+            self.assertAlmostEqual(table[raw], expected, places=9)
+
+    def test_rail_codes_are_invalid(self):
+        """A shorted or open thermistor reads as a failed read, not absolute zero"""
+        temperatures = self.resource.convert_raw_to_temperature([0, self.max_code])
+        self.assertTrue(np.all(temperatures == TemperatureResource.INVALID_TEMPERATURE))
+
+        self.resource.adc._mock_value = 0
+        self.assertEqual(self.resource.find_temperature(), TemperatureResource.INVALID_TEMPERATURE)
+        self.assertEqual(self.resource._on_read_temperature(), -128)
+
+    def test_batch_conversion_shape(self):
+        raw = np.array([[1, 1000], [2047, 4000]])
+        temperatures = self.resource.convert_raw_to_temperature(raw)
+
+        self.assertEqual(temperatures.shape, raw.shape)
+        self.assertEqual(temperatures[1, 0], self.resource.temperature_table[2047])
+        self.assertEqual(np.ndim(self.resource.convert_raw_to_temperature(2047)), 0)
+
+    def test_out_of_range_codes_rejected(self):
+        with self.assertRaises(ValueError):
+            self.resource.convert_raw_to_temperature(-1)
+        with self.assertRaises(ValueError):
+            self.resource.convert_raw_to_temperature([1, self.max_code + 1])
+
+    def test_non_integer_codes_rejected(self):
+        """Fractional codes aren't truncated to the code below"""
+        for raw in [1.9, [1, 2.5], np.array([1.0, 2.0])]:
+            with self.assertRaises(ValueError):
+                self.resource.convert_raw_to_temperature(raw)
+
+        codes = np.array([1, 2], dtype=np.uint16)
+        self.assertEqual(self.resource.convert_raw_to_temperature(codes).shape, (2,))
+
+    def test_mock_reading(self):
+        """The mock ADC sits mid-scale, where the thermistor equals R25"""
+        self.assertAlmostEqual(self.resource.find_temperature(), 25.0, places=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for the thermal transmit duty-cycle scheduler"""
+
+import unittest
+
+from oresat_dxwifi.transmission.thermal import ThermalScheduler, ThermalState
+
+
+class TestThermalScheduler(unittest.TestCase):
+    def setUp(self):
+        self.temperature = 20.0
+        self.scheduler = ThermalScheduler(lambda: self.temperature)
+        self.scheduler.poll_interval = 0
+
+    def read(self, temperature: float) -> ThermalState:
+        self.temperature = temperature
+        return self.scheduler.update()
+
+    def test_hysteresis(self):
+        s = self.scheduler
+        self.assertEqual(self.read(s.throttle_temp - 1), ThermalState.NOMINAL)
+        self.assertEqual(self.read(s.throttle_temp), ThermalState.THROTTLED)
+        # Stays throttled until the radio reaches the unthrottle temperature
+        self.assertEqual(self.read(s.throttle_temp - 0.1), ThermalState.THROTTLED)
+        self.assertEqual(self.read(s.unthrottle_temp + 1), ThermalState.THROTTLED)
+        self.assertEqual(self.read(s.unthrottle_temp), ThermalState.NOMINAL)
+        self.assertEqual(self.read(s.unthrottle_temp + 1), ThermalState.NOMINAL)
+        self.assertEqual(self.read(s.throttle_temp), ThermalState.THROTTLED)
+        self.assertEqual(self.read(s.pause_temp), ThermalState.PAUSED)
+        # Stays paused until the radio reaches the resume temperature
+        self.assertEqual(self.read(s.resume_temp + 1), ThermalState.PAUSED)
+        self.assertEqual(self.read(s.resume_temp), ThermalState.NOMINAL)
+
+    def test_failed_reads_keep_state(self):
+        """Failed reads (-1000) and absolute zero never unpause a hot radio"""
+        self.read(self.scheduler.pause_temp)
+
+        for temperature in [-1000.0, -273.15]:
+            self.assertEqual(self.read(temperature), ThermalState.PAUSED)
+
+    def test_throttled_file_delay_applied_once(self):
+        self.read(self.scheduler.throttle_temp)
+
+        self.assertNotIn("file_delay", self.scheduler.tx_overrides())
+        self.assertEqual(self.scheduler.file_delay(), self.scheduler.throttle_file_delay / 1000)
+
+    def test_wait_for_cooldown_gives_up(self):
+        self.read(self.scheduler.pause_temp)
+        self.scheduler.max_pause = 0
+
+        self.assertFalse(self.scheduler.wait_for_cooldown())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for encoding capture bursts into a video"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from oresat_dxwifi.camera.frame import Frame
+from oresat_dxwifi.camera.video import VideoEncodeError, encode_frames
+
+JPEG = b"\xff\xd8" + b"\x00" * 64 + b"\xff\xd9"
+
+
+class TestEncodeFrames(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.frames = [Frame(JPEG) for _ in range(3)]
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_unknown_codec(self):
+        with self.assertRaises(VideoEncodeError):
+            encode_frames(self.frames, self.output_dir, 5, "vp9", 5)
+
+    def test_ffmpeg_failure_leaves_no_output(self):
+        def fail(cmd, **kwargs):
+            with open(cmd[-1], "wb") as f:
+                f.write(b"partial")
+            return subprocess.CompletedProcess(cmd, 1, stderr=b"encoder error")
+
+        with mock.patch("subprocess.run", side_effect=fail):
+            with self.assertRaises(VideoEncodeError):
+                encode_frames(self.frames, self.output_dir, 5, "h264", 5)
+
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_missing_ffmpeg(self):
+        with mock.patch("subprocess.run", side_effect=FileNotFoundError("ffmpeg")):
+            with self.assertRaises(VideoEncodeError):
+                encode_frames(self.frames, self.output_dir, 5, "mjpeg", 5)
+
+    def test_ffmpeg_arguments(self):
+        def encode(cmd, **kwargs):
+            frame_dir = os.path.dirname(cmd[cmd.index("-i") + 1])
+            self.assertEqual(len(os.listdir(frame_dir)), len(self.frames))
+            with open(cmd[-1], "wb") as f:
+                f.write(b"video")
+            return subprocess.CompletedProcess(cmd, 0, stderr=b"")
+
+        with mock.patch("subprocess.run", side_effect=encode) as run:
+            filepath = encode_frames(self.frames, self.output_dir, 5, "h264", 10)
+
+        cmd = run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-g") + 1], "10")
+        self.assertEqual(cmd[cmd.index("-framerate") + 1], "5")
+        self.assertTrue(filepath.endswith(".mp4"))
+        self.assertTrue(os.path.isfile(filepath))
+
+
+if __name__ == "__main__":
+    unittest.main()